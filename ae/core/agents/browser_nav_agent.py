@@ -14,6 +14,7 @@ from ae.core.skills.get_dom_with_content_type import get_dom_with_content_type
 from ae.core.skills.get_url import geturl
 from ae.core.skills.get_user_input import get_user_input
 from ae.core.skills.open_url import openurl
+from ae.core.skills.run_actions import run_actions
 
 
 class BrowserNavAgent:
@@ -99,6 +100,11 @@ class BrowserNavAgent:
         # Register entertext skill for LLM by assistant agent
         self.agent.register_for_llm(description=LLM_PROMPTS["ENTER_TEXT_PROMPT"])(entertext)
 
+        # Register run_actions skill for execution by user_proxy_agent
+        self.user_proxy_agent.register_for_execution()(run_actions)
+        # Register run_actions skill for LLM by assistant agent
+        self.agent.register_for_llm(description=LLM_PROMPTS["RUN_ACTIONS_PROMPT"])(run_actions)
+
         # Register reply function for printing messages
         self.user_proxy_agent.register_reply( # type: ignore
             [autogen.Agent, None],
@@ -8,7 +8,9 @@ from playwright.async_api import Page
 from playwright.async_api import Playwright
 
 from ae.core.ui_manager import UIManager
+from ae.utils.js_helper import AE_HELPERS_JS
 from ae.utils.js_helper import escape_js_message
+from ae.utils.js_helper import evaluate_ae_helper
 from ae.utils.logger import logger
 
 
@@ -54,6 +56,10 @@ class PlaywrightManager:
         self.isheadless = headless
         self.__initialized = True
         self.user_response_event = asyncio.Event()
+        self._pending_highlight: str | None = None
+        self._pending_notifications: list[str] = []
+        self._pending_ui_flush: asyncio.TimerHandle | None = None
+        self._ui_flush_task: asyncio.Task[None] | None = None
         if gui_input_mode:
             self.ui_manager: UIManager = UIManager()
 
@@ -90,6 +96,7 @@ class PlaywrightManager:
         """
         Setup various handlers after the browser context has been ensured.
         """
+        await self.set_ae_helpers_init_script()
         await self.set_overlay_state_handler()
         await self.set_user_response_handler()
         await self.set_navigation_handler()
@@ -236,6 +243,12 @@ class PlaywrightManager:
         page.on("domcontentloaded", self.ui_manager.handle_navigation) # type: ignore
 
 
+    async def set_ae_helpers_init_script(self):
+        logger.debug("Registering helper functions init script")
+        context = await self.get_browser_context()
+        await context.add_init_script(script=AE_HELPERS_JS) # type: ignore
+
+
     async def set_overlay_state_handler(self):
         logger.debug("Setting overlay state handler")
         context = await self.get_browser_context()
@@ -293,6 +306,80 @@ class PlaywrightManager:
             # This is not significant enough to fail the operation
             pass
 
+    def schedule_highlight(self, selector: str):
+        """
+        Highlight an element without waiting for the browser. Highlights requested in quick succession are
+        coalesced so that only the last one is applied.
+
+        Args:
+            selector (str): The query selector of the element to highlight.
+        """
+        self._pending_highlight = selector
+        self._schedule_ui_flush()
+
+
+    def schedule_notify_user(self, message: str):
+        """
+        Notify the user with a message without waiting for the browser. Notifications requested in quick succession
+        are sent to the page together in a single call.
+
+        Args:
+            message (str): The message to notify the user with.
+        """
+        logger.debug(f"Notification: \"{message}\" scheduled to be sent to the user.")
+        self.ui_manager.new_system_message(escape_js_message(message))
+        self._pending_notifications.append(message)
+        self._schedule_ui_flush()
+
+
+    def _schedule_ui_flush(self, delay: float = 0.05):
+        # _pending_ui_flush stays set until the flush task has finished, so only one flush is scheduled or running at a time
+        if self._pending_ui_flush is None:
+            loop = asyncio.get_running_loop()
+            self._pending_ui_flush = loop.call_later(delay, self._start_ui_flush)
+
+
+    def _start_ui_flush(self):
+        self._ui_flush_task = asyncio.ensure_future(self._flush_pending_ui_updates())
+        self._ui_flush_task.add_done_callback(self._ui_flush_done)
+
+
+    def _ui_flush_done(self, task: "asyncio.Task[None]"):
+        self._ui_flush_task = None
+        self._pending_ui_flush = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Flushing highlight and user notifications failed: {task.exception()}")
+        # Updates requested while the flush was running are sent with the next flush
+        if self._pending_highlight is not None or self._pending_notifications:
+            self._schedule_ui_flush()
+
+
+    async def _flush_pending_ui_updates(self):
+        selector, messages = self._pending_highlight, self._pending_notifications
+        self._pending_highlight, self._pending_notifications = None, []
+        try:
+            page: Page = await self.get_current_page()
+            await evaluate_ae_helper(page, """(params) => {
+                if (params.selector) {
+                    // An invalid selector must not prevent the notifications below from being delivered
+                    try {
+                        const e = window.__aeFindElement(params.selector);
+                        if (e) {
+                            window.__aeHighlight(e);
+                        }
+                    } catch (error) {
+                        console.log(`Unable to highlight element with selector ${params.selector}: ${error.message}`);
+                    }
+                }
+                for (const message of params.messages) {
+                    addSystemMessage(message, false);
+                }
+            }""", {"selector": selector, "messages": messages})
+            logger.debug(f"Flushed highlight of {selector} and {len(messages)} user notifications")
+        except Exception as e:
+            logger.debug(f"Failed to flush highlight and user notifications. However, most likey this will work itself out after the page loads: {e}")
+
+
     async def receive_user_response(self, response: str):
         self.user_response = response  # Store the response for later use.
         logger.debug(f"Received user response to system prompt: {response}")
@@ -358,3 +445,20 @@ class PlaywrightManager:
         logger.debug(f"Command \"{command}\" has been completed. Focusing on the overlay input if it is open.")
         page = await self.get_current_page()
         await self.ui_manager.command_completed(page, command, elapsed_time)
+
+
+_manager: PlaywrightManager | None = None
+
+
+def get_playwright_manager() -> PlaywrightManager:
+    """
+    Returns the process-wide PlaywrightManager, creating it on first use.
+    Skills call this on every invocation, so the instance is kept at module level instead of going through the singleton constructor each time.
+
+    Returns:
+        PlaywrightManager: The shared PlaywrightManager instance.
+    """
+    global _manager
+    if _manager is None:
+        _manager = PlaywrightManager(browser_type='chromium', headless=False)
+    return _manager
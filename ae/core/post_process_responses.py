@@ -2,7 +2,7 @@ from typing import Any
 
 import autogen  # type: ignore
 
-from ae.core.playwright_manager import PlaywrightManager
+from ae.core.playwright_manager import get_playwright_manager
 from ae.utils.logger import logger
 
 
@@ -60,7 +60,7 @@ async def final_reply_callback_browser_agent(recipient: autogen.ConversableAgent
     if last_message.get('content') and "##TERMINATE##" in last_message['content']:
         last_agent_response = last_message['content'].replace("##TERMINATE##", "").strip()
         if last_agent_response:
-            browser_manager = PlaywrightManager(browser_type='chromium', headless=False)
+            browser_manager = get_playwright_manager()
             await browser_manager.notify_user(last_agent_response)
             logger.debug("*****Final Reply*****")
             logger.debug(f"Final Response: {last_agent_response}")
@@ -10,6 +10,7 @@ LLM_PROMPTS = {
     The given functions are NOT parallelizable. They are intended for sequential execution.
     If you need to call multiple functions in a task step, call one function at a time. Wait for the function's response before invoking the next function. This is important to avoid collision.
     Some of the provided functions do provide bulk operations, for those, the function description will clearly mention it.
+    Failed actions return an error code followed by the selector, e.g. "ERR_SELECTOR_NOT_FOUND [mmid='12']". ERR_SELECTOR_NOT_FOUND and ERR_INVALID_SELECTOR mean you should retrieve the DOM again before retrying.
     For information seeking tasks where a text response is expected, the returned answer should answer the question as directly as possible and should be followed by ##TERMINATE##.
     If your approach fails try again with a different approach in hopes of a better outcome, but don't do this endlessly.
     Ensure that user questions are answered from the DOM and not from memory or assumptions.
@@ -60,6 +61,12 @@ LLM_PROMPTS = {
     This will only enter the text and not press enter or anything else.
     Returns each selector and the result for attempting to enter text.""",
 
+    "RUN_ACTIONS_PROMPT": """Performs a sequence of click, fill and select actions on the current web page in one step. To be used when several actions on the same page can be performed one after another without reading the DOM in between.
+    Each action contains the operation ('click', 'fill' or 'select'), the DOM query selector matching the given mmid attribute value and, for 'fill' and 'select', the value.
+    Actions are performed in order and execution stops at the first failure, or after a click on a link or a form submit button, since it loads a new page. The remaining actions are returned as SKIPPED; retrieve the DOM before performing them.
+    ERR_ACTION_RESULT_UNKNOWN means the page changed before the results were returned; retrieve the DOM to check what was done before retrying.
+    Returns each selector and the result for attempting the action.""",
+
     "PRESS_KEY_COMBINATION_PROMPT": """Presses the given key combination on the current web page.
     This is useful for keycombinations or even just pressing the enter button to submit a search query.""",
 
@@ -1,11 +1,14 @@
 import asyncio
-import traceback
 from typing import Annotated
+from typing import Any
 
 from playwright.async_api import ElementHandle
+from playwright.async_api import Error as PlaywrightError
 from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-from ae.core.playwright_manager import PlaywrightManager
+from ae.core.playwright_manager import get_playwright_manager
+from ae.utils.js_helper import evaluate_ae_helper
 from ae.utils.logger import logger
 
 
@@ -20,20 +23,19 @@ async def click(selector: Annotated[str, "The properly formed query selector str
     - wait_before_execution: Optional wait time in seconds before executing the click event logic. Defaults to 0.0 seconds.
 
     Returns:
-    - Success if the click was successful, Appropropriate error message otherwise.
+    - Success if the click was successful, an error code followed by the selector otherwise (ERR_SELECTOR_NOT_FOUND, ERR_INVALID_SELECTOR or ERR_CLICK_FAILED).
     """
     logger.info(f"Executing ClickElement with \"{selector}\" as the selector")
 
     # Initialize PlaywrightManager and get the active browser page
-    browser_manager = PlaywrightManager(browser_type='chromium', headless=False)
+    browser_manager = get_playwright_manager()
     page = await browser_manager.get_current_page()
 
     if page is None: # type: ignore
         raise ValueError('No active page found. OpenURL command opens a new page.')
 
-    await browser_manager.highlight_element(selector, True)
     result = await do_click(page, selector, wait_before_execution)
-    await browser_manager.notify_user(result)
+    browser_manager.schedule_notify_user(result)
     return result
 
 
@@ -47,7 +49,7 @@ async def do_click(page: Page, selector: str, wait_before_execution: float) -> s
     - wait_before_execution: Optional wait time in seconds before executing the click event logic.
 
     Returns:
-    - A message indicating success or failure of the click.
+    - A message indicating success of the click, or an error code followed by the selector on failure.
     """
     logger.info(f"Executing ClickElement with \"{selector}\" as the selector. Wait time before execution: {wait_before_execution} seconds.")
 
@@ -55,52 +57,80 @@ async def do_click(page: Page, selector: str, wait_before_execution: float) -> s
     if wait_before_execution > 0:
         await asyncio.sleep(wait_before_execution)
 
-    # Wait for the selector to be present and ensure it's attached and visible. If timeout, try javascript click
+    # Fast path: highlight, scroll, focus and click the element in a single round trip when it is already in the DOM
     try:
-        logger.info(f"Executing ClickElement with \"{selector}\" as the selector. Waiting for the element to be attached and visible.")
-
-        element = await asyncio.wait_for(
-            page.wait_for_selector(selector, state="attached", timeout=2000),
-            timeout=2000
-        )
-        if element is None:
-            raise ValueError(f"Element with selector: \"{selector}\" not found")
-
-        logger.info(f"Element with selector: \"{selector}\" is attached. scrolling it into view if needed.")
-        try:
-            await element.scroll_into_view_if_needed(timeout=200)
-            logger.info(f"Element with selector: \"{selector}\" is attached and scrolled into view. Waiting for the element to be visible.")
-        except Exception:
-            # If scrollIntoView fails, just move on, not a big deal
-            pass
-
-        try:
-            await element.wait_for_element_state("visible", timeout=200)
-            logger.info(f"Executing ClickElement with \"{selector}\" as the selector. Element is attached and visibe. Clicking the element.")
-        except Exception:
-            # If the element is not visible, try to click it anyway
-            pass
-
-        element_tag_name = await element.evaluate("element => element.tagName.toLowerCase()")
-
-        if element_tag_name == "option":
-            element_value = await element.get_attribute("value") # get the text that is in the value of the option
-            parent_element = await element.evaluate_handle("element => element.parentNode")
-            # await parent_element.evaluate(f"element => element.select_option(value=\"{element_value}\")")
-            await parent_element.select_option(value=element_value) # type: ignore
-
-            logger.info(f'Select menu option "{element_value}" selected')
-            return f'Select menu option "{element_value}" selected'
-        await element.focus()
+        fused_result = await perform_fused_click(page, selector)
+        if fused_result["action"] != "not_found":
+            return click_result_message(selector, fused_result)
+        logger.info(f"Element with selector: \"{selector}\" is not attached yet. Waiting for it before clicking.")
+    except PlaywrightError as e:
+        # querySelector throws a SyntaxError for a malformed selector. Anything else (e.g. the execution context being
+        # destroyed by a navigation in progress) is left to the locator below, which waits for the element
+        if "SyntaxError" in str(e) or "is not a valid selector" in str(e):
+            logger.error(f"Unable to click element with selector: \"{selector}\". Error: {e}")
+            return f"ERR_INVALID_SELECTOR {selector}"
+        logger.info(f"Unable to click element with selector: \"{selector}\" in a single step. Waiting for it before clicking. Error: {e}")
+
+    # The locator waits for the element to be attached, then the same JavaScript click is retried
+    try:
+        logger.info(f"Executing ClickElement with \"{selector}\" as the selector. Waiting for the element to be attached.")
+        await page.locator(selector).first.wait_for(state="attached", timeout=2000)
         #Playwright click seems to fail more often than not, disabling it for now and just going with JS click
         #await perform_playwright_click(element, selector)
-        await perform_javascript_click(page, selector)
-
-        return f"Element with selector: \"{selector}\" clicked."
+        result = await perform_javascript_click(page, selector)
+        return click_result_message(selector, result)
+    except PlaywrightTimeoutError:
+        logger.error(f"Unable to click element with selector: \"{selector}\". Element was not attached within 2 seconds.")
+        return f"ERR_SELECTOR_NOT_FOUND {selector}"
     except Exception as e:
-        logger.error(f"Unable to click element with selector: \"{selector}\". Error: {e}")
-        traceback.print_exc()
-        return f"Unable to click element with selector: \"{selector}\" since the selector is invalid. Proceed by retrieving DOM again."
+        logger.exception(f"Unable to click element with selector: \"{selector}\". Error: {e}")
+        return f"ERR_CLICK_FAILED {selector}"
+
+
+def click_result_message(selector: str, result: dict[str, Any] | None) -> str:
+    """
+    Converts the outcome reported by the window.__aeClick helper into the message returned by the click skill.
+
+    Parameters:
+    - selector: The query selector string of the element.
+    - result: The outcome reported by the helper, or None if the script could not be executed.
+
+    Returns:
+    - A message indicating success of the click, or an error code followed by the selector on failure.
+    """
+    if result is None:
+        return f"ERR_CLICK_FAILED {selector}"
+    if result["action"] == "not_found":
+        logger.error(f"Unable to click element with selector: \"{selector}\". Element not found.")
+        return f"ERR_SELECTOR_NOT_FOUND {selector}"
+    if not result["ok"]:
+        logger.error(f"Unable to click element with selector: \"{selector}\". Option element is not inside a select element.")
+        return f"ERR_CLICK_FAILED {selector}"
+    if not result["visible"]:
+        logger.info(f"Element with selector: \"{selector}\" is not visible. Clicked it anyway.")
+    if result["action"] == "select":
+        logger.info(f'Select menu option "{result["value"]}" selected')
+        return f'Select menu option "{result["value"]}" selected'
+    return f"Element with selector: \"{selector}\" clicked."
+
+
+async def perform_fused_click(page: Page, selector: str, add_highlight: bool = True) -> dict[str, Any]:
+    """
+    Highlights, scrolls into view, focuses and clicks the element in a single call to the window.__aeClick helper.
+    For option elements, the option is selected in the parent select element instead of clicking it.
+
+    Parameters:
+    - page: The Playwright page instance.
+    - selector: The query selector string of the element.
+    - add_highlight: Whether to apply the pulsating border effect to the element. Defaults to True.
+
+    Returns:
+    - A dictionary with 'ok', 'action' ('click', 'select', 'not_found' or 'error'), 'value' and 'text'
+      (the selected option value and text for 'select') and 'visible' (whether the element had a non-empty bounding box).
+    """
+    logger.info(f"Executing fused JavaScript click on element with selector: {selector}")
+    result: dict[str, Any] = await evaluate_ae_helper(page, "(params) => window.__aeClick(params.selector, {highlight: params.add_highlight})", {"selector": selector, "add_highlight": add_highlight})
+    return result
 
 
 async def is_element_present(page: Page, selector: str) -> bool:
@@ -133,53 +163,22 @@ async def perform_playwright_click(element: ElementHandle, selector: str):
     await element.click(force=False, timeout=200)
 
 
-async def perform_javascript_click(page: Page, selector: str):
+async def perform_javascript_click(page: Page, selector: str) -> dict[str, Any] | None:
     """
-    Performs a click action on the element using JavaScript.
+    Performs a click action on the element using the window.__aeClick helper installed on the page.
 
     Parameters:
     - page: The Playwright page instance.
     - selector: The query selector string of the element.
 
     Returns:
-    - None
+    - The structured outcome reported by the helper (see perform_fused_click), or None if the script could not be executed.
     """
-    js_code = """(selector) => {
-        let element = document.querySelector(selector);
-
-        if (!element) {
-            console.log(`perform_javascript_click: Element with selector ${selector} not found`);
-            return `perform_javascript_click: Element with selector ${selector} not found`;
-        }
-
-        if (element.tagName.toLowerCase() === "option") {
-            let value = element.text;
-            let parent = element.parentElement;
-
-            parent.value = element.value; // Directly set the value if possible
-            // Trigger change event if necessary
-            let event = new Event('change', { bubbles: true });
-            parent.dispatchEvent(event);
-
-            console.log("Select menu option", value, "selected");
-            return "Select menu option: "+ value+ " selected";
-        }
-        else {
-            console.log("About to click selector", selector);
-            // If the element is a link, make it open in the same tab
-            if (element.tagName.toLowerCase() === "a") {
-                element.target = "_self";
-            }
-            element.click();
-            return "Executed JavaScript Click on element with selector: "+selector;
-        }
-    }"""
     try:
         logger.info(f"Executing JavaScript click on element with selector: {selector}")
-        result:str = await page.evaluate(js_code, selector)
+        result: dict[str, Any] = await evaluate_ae_helper(page, "(selector) => window.__aeClick(selector)", selector)
         logger.debug(f"Executed JavaScript Click on element with selector: {selector}")
         return result
     except Exception as e:
-        logger.error(f"Error executing JavaScript click on element with selector: {selector}. Error: {e}")
-        traceback.print_exc()
-
+        logger.exception(f"Error executing JavaScript click on element with selector: {selector}. Error: {e}")
+        return None
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from ae.core.playwright_manager import PlaywrightManager
+from ae.core.playwright_manager import get_playwright_manager
 from ae.core.skills.click_using_selector import do_click
 from ae.core.skills.enter_text_using_selector import do_entertext
 from ae.core.skills.press_key_combination import do_press_key_combination
@@ -36,7 +36,7 @@ async def enter_text_and_click(
     logger.info(f"Entering text '{text_to_enter}' into element with selector '{text_selector}' and then clicking element with selector '{click_selector}'.")
 
     # Initialize PlaywrightManager and get the active browser page
-    browser_manager = PlaywrightManager(browser_type='chromium', headless=False)
+    browser_manager = get_playwright_manager()
     page = await browser_manager.get_current_page()
     if page is None: # type: ignore
         logger.error("No active page found")
@@ -60,7 +60,6 @@ async def enter_text_and_click(
             result += f" Clicking the same element after entering text in it, is of no value. Tried pressing the Enter key on element \"{click_selector}\" instead of click and failed."
             await browser_manager.notify_user("Failed to press the Enter key on element \"{click_selector}\".")
     else:
-        await browser_manager.highlight_element(click_selector, True)
         do_click_result = await do_click(page, click_selector, wait_before_click_execution)
         result += f" {do_click_result}"
         await browser_manager.notify_user(do_click_result)
@@ -1,16 +1,17 @@
-import asyncio
-import traceback
 from dataclasses import dataclass
 from typing import Annotated
+from typing import Any
 from typing import List  # noqa: UP035
 
 from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-from ae.core.playwright_manager import PlaywrightManager
+from ae.core.playwright_manager import get_playwright_manager
+from ae.utils.js_helper import evaluate_ae_helper
 from ae.utils.logger import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class EnterTextEntry:
     """
     Represents an entry for text input.
@@ -24,17 +25,14 @@ class EnterTextEntry:
     text: str
 
     def __getitem__(self, key: str) -> str:
-        if key == "query_selector":
-            return self.query_selector
-        elif key == "text":
-            return self.text
-        else:
-            raise KeyError(f"{key} is not a valid key")
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(f"{key} is not a valid key")
 
 
-async def custom_fill_element(page: Page, selector: str, text_to_enter: str):
+async def custom_fill_element(page: Page, selector: str, text_to_enter: str) -> dict[str, Any]:
     """
-    Sets the value of a DOM element to a specified text without triggering keyboard input events.
+    Sets the value of a DOM element to a specified text without triggering keyboard events.
 
     This function directly sets the 'value' property of a DOM element identified by the given CSS selector,
     effectively changing its current value to the specified text. This approach bypasses the need for
@@ -47,19 +45,65 @@ async def custom_fill_element(page: Page, selector: str, text_to_enter: str):
                         text change to the first element that matches this selector.
         text_to_enter (str): The text value to be set in the target element. Existing content will be overwritten.
 
+    Returns:
+        dict[str, Any]: The outcome reported by the window.__aeFill helper, with the keys 'ok', 'value', 'has_placeholder' and 'error'.
+
     Example:
         await custom_fill_element(page, '#username', 'test_user')
 
     Note:
-        This function does not trigger input-related events (like 'input' or 'change'). If application logic
-        relies on these events being fired, additional steps may be needed to simulate them.
+        The value is set through the element's native value setter and 'input' and 'change' events are dispatched
+        afterwards, so that framework controlled inputs (e.g. React) pick up the change. No keyboard events are triggered.
     """
     selector = f"{selector}"  # Ensures the selector is treated as a string
-    await page.evaluate("""(inputParams) => {
-        const selector = inputParams.selector;
-        const text_to_enter = inputParams.text_to_enter;
-        document.querySelector(selector).value = text_to_enter;
-    }""", {"selector": selector, "text_to_enter": text_to_enter})
+    return await evaluate_ae_helper(page, "(inputParams) => window.__aeFill(inputParams.selector, inputParams.text_to_enter)", {"selector": selector, "text_to_enter": text_to_enter})
+
+
+async def custom_fill_elements(page: Page, pairs: list[tuple[str, str]], add_highlight: bool = False) -> list[dict[str, Any]]:
+    """
+    Sets the values of multiple DOM elements in a single round trip to the browser.
+
+    Each element is located with its CSS selector, its 'value' property is set to the given text and
+    'input' and 'change' events are dispatched so that application logic listening for them is notified.
+    Pairs are processed in order, so later entries for the same selector overwrite earlier ones.
+
+    Args:
+        page (Page): The Playwright Page object representing the browser tab in which the operation will be performed.
+        pairs (list[tuple[str, str]]): A list of (selector, text_to_enter) pairs.
+        add_highlight (bool, optional): Whether to apply the pulsating border effect to each filled element. Defaults to False.
+
+    Returns:
+        list[dict[str, Any]]: One result per pair, in the same order, as reported by the window.__aeFill helper,
+                              with the keys 'ok', 'value', 'has_placeholder' and 'error'.
+
+    Example:
+        results = await custom_fill_elements(page, [('#username', 'test_user'), ('#password', 'test_password')])
+    """
+    return await evaluate_ae_helper(page, "(inputParams) => inputParams.pairs.map(([selector, text_to_enter]) => window.__aeFill(selector, text_to_enter, {highlight: inputParams.add_highlight}))",
+                                    {"pairs": [list(pair) for pair in pairs], "add_highlight": add_highlight})
+
+
+async def dismiss_placeholder(page: Page, selector: str, text_to_enter: str):
+    """
+    Types a space followed by backspace into an element so that placeholders which only disappear upon keyboard input are cleared.
+
+    Args:
+        page (Page): The Playwright Page object representing the browser tab in which the operation will be performed.
+        selector (str): The CSS selector string used to locate the target DOM element.
+        text_to_enter (str): The text that was entered in the element, used to wait for its value to settle.
+    """
+    await page.focus(selector, timeout=2000)
+    await page.keyboard.type(" ")
+    await page.keyboard.press("Backspace")
+    try:
+        await page.wait_for_function("""([selector, text_to_enter]) => {
+            const element = window.__aeFindElement(selector);
+            return element && (element.value || '').includes(text_to_enter);
+        }""", arg=[selector, text_to_enter], timeout=500)
+    except PlaywrightTimeoutError:
+        # Not every element exposes a value (e.g. contenteditable), so do not fail the entry
+        logger.debug(f"Value of element with selector {selector} did not reflect the entered text within the timeout")
+
 
 async def entertext(entry: Annotated[EnterTextEntry, "An object containing 'query_selector' (DOM selector query using mmid attribute) and 'text' (text to enter on the element)."]) -> Annotated[str, "Explanation of the outcome of this operation."]:
     """
@@ -87,27 +131,26 @@ async def entertext(entry: Annotated[EnterTextEntry, "An object containing 'quer
         - If no active page is found, an error message is returned.
         - The function internally calls the 'do_entertext' function to perform the text entry operation.
         - The 'do_entertext' function applies a pulsating border effect to the target element during the operation.
-        - The 'use_keyboard_fill' parameter in 'do_entertext' determines whether to simulate keyboard typing or not.
-        - If 'use_keyboard_fill' is set to True, the function uses the 'page.keyboard.type' method to enter the text.
-        - If 'use_keyboard_fill' is set to False, the function uses the 'custom_fill_element' method to enter the text.
+        - The function does not set 'use_keyboard_fill', so 'do_entertext' uses the 'custom_fill_element' method to enter the text,
+          unless the element is contenteditable.
     """
     logger.info(f"Entering text: {entry}")
     query_selector: str = entry['query_selector']
     text_to_enter: str = entry['text']
 
     # Create and use the PlaywrightManager
-    browser_manager = PlaywrightManager(browser_type='chromium', headless=False)
+    browser_manager = get_playwright_manager()
     page = await browser_manager.get_current_page()
     if page is None: # type: ignore
-        return "Error: No active page found. OpenURL command opens a new page."
+        return "ERR_NO_ACTIVE_PAGE"
 
-    await browser_manager.highlight_element(query_selector, True)
+    browser_manager.schedule_highlight(query_selector)
     result = await do_entertext(page, query_selector, text_to_enter)
-    await browser_manager.notify_user(result)
+    browser_manager.schedule_notify_user(result)
     return result
 
 
-async def do_entertext(page: Page, selector: str, text_to_enter: str, use_keyboard_fill: bool=False):
+async def do_entertext(page: Page, selector: str, text_to_enter: str, use_keyboard_fill: bool=False, typing_delay_ms: float=0):
     """
     Performs the text entry operation on a DOM element.
 
@@ -121,6 +164,8 @@ async def do_entertext(page: Page, selector: str, text_to_enter: str, use_keyboa
         text_to_enter (str): The text value to be set in the target element. Existing content will be overwritten.
         use_keyboard_fill (bool, optional): Determines whether to simulate keyboard typing or not.
                                             Defaults to False.
+        typing_delay_ms (float, optional): Delay between key presses in milliseconds when simulating keyboard typing.
+                                           Defaults to 0.
 
     Returns:
         str: Explanation of the outcome of this operation.
@@ -131,7 +176,8 @@ async def do_entertext(page: Page, selector: str, text_to_enter: str, use_keyboa
     Note:
         - The 'use_keyboard_fill' parameter determines whether to simulate keyboard typing or not.
         - If 'use_keyboard_fill' is set to True, the function uses the 'page.keyboard.type' method to enter the text.
-        - If 'use_keyboard_fill' is set to False, the function uses the 'custom_fill_element' method to enter the text.
+        - If 'use_keyboard_fill' is set to False, the function uses the faster 'custom_fill_element' method to enter the text,
+          unless the element is contenteditable, which has no value to set and is typed into instead.
     """
     try:
         logger.debug(f"Looking for selector {selector} to enter text: {text_to_enter}")
@@ -139,26 +185,33 @@ async def do_entertext(page: Page, selector: str, text_to_enter: str, use_keyboa
         elem = await page.query_selector(selector)
 
         if elem is None:
-            return f"Error: Selector {selector} not found. Unable to continue."
+            return f"ERR_SELECTOR_NOT_FOUND {selector}"
 
         logger.info(f"Found selector {selector} to enter text")
+        # Contenteditable elements have no value property, so a directly set value is ignored
+        element_info: dict[str, bool] = await elem.evaluate("""element => ({
+            has_placeholder: !!element.placeholder,
+            is_content_editable: element.isContentEditable
+        })""")
 
-        if use_keyboard_fill:
+        if use_keyboard_fill or element_info["is_content_editable"]:
             await elem.focus()
             logger.debug(f"Focused element with selector {selector} to enter text")
-            await page.keyboard.type(text_to_enter, delay=2)
+            await page.keyboard.type(text_to_enter, delay=typing_delay_ms)
         else:
-            await custom_fill_element(page, selector, text_to_enter)
+            fill_result = await custom_fill_element(page, selector, text_to_enter)
+            if not fill_result["ok"]:
+                return f"ERR_SELECTOR_NOT_FOUND {selector}"
+            # some html pages can have placeholders that only disappear upon keyboard input
+            if element_info["has_placeholder"]:
+                await dismiss_placeholder(page, selector, text_to_enter)
         logger.info(f"Success. Text \"{text_to_enter}\" set successfully in the element with selector {selector}")
-        await elem.focus()
-        await page.keyboard.type(" ") # some html pages can have placeholders that only disappear upon keyboard input
-        await asyncio.sleep(1)
 
         return f"Success. Text \"{text_to_enter}\" set successfully in the element with selector {selector}"
 
     except Exception as e:
-        traceback.print_exc()
-        return f"Error entering text in selector {selector}. Error: {str(e)}"
+        logger.exception(f"Error entering text in selector {selector}. Error: {e}")
+        return f"ERR_ENTER_TEXT_FAILED {selector}"
 
 
 async def bulk_enter_text(
@@ -169,7 +222,8 @@ async def bulk_enter_text(
 
     This function enters text into multiple DOM elements using a bulk operation.
     It takes a list of dictionaries, where each dictionary contains a 'query_selector' and 'text' pair.
-    The function internally calls the 'entertext' function to perform the text entry operation for each entry.
+    The values of all the elements are set in a single round trip to the browser using 'custom_fill_elements'.
+    Elements with a placeholder then need a few more round trips each, to focus them and type a space and backspace.
 
     Args:
         entries: List of objects, each containing 'query_selector' and 'text'.
@@ -189,14 +243,40 @@ async def bulk_enter_text(
         - The result is a list of dictionaries, where each dictionary contains the 'query_selector' and the result of the operation.
     """
 
-    results: List[dict[str, str]] = []  # noqa: UP006
     logger.info("Executing bulk Enter Text Command")
-    for entry in entries:
-        query_selector = entry['query_selector']
-        text_to_enter = entry['text']
-        logger.info(f"Entering text: {text_to_enter} in element with selector: {query_selector}")
-        result = await entertext(EnterTextEntry(query_selector=query_selector, text=text_to_enter))
 
+    browser_manager = get_playwright_manager()
+    page = await browser_manager.get_current_page()
+    if page is None: # type: ignore
+        return [{"query_selector": entry['query_selector'], "result": "ERR_NO_ACTIVE_PAGE"} for entry in entries]
+
+    # Set the values of all the elements in a single round trip to the browser
+    pairs = [(entry['query_selector'], entry['text']) for entry in entries]
+    try:
+        fill_results = await custom_fill_elements(page, pairs, add_highlight=True)
+    except Exception as e:
+        logger.error(f"Error entering text in bulk. Error: {e}")
+        return [{"query_selector": selector, "result": f"ERR_ENTER_TEXT_FAILED {selector}"} for selector, _ in pairs]
+
+    results: List[dict[str, str]] = []  # noqa: UP006
+    for (query_selector, text_to_enter), fill_result in zip(pairs, fill_results, strict=True):
+        if not fill_result['ok'] and fill_result['error'] == "not found":
+            result = f"ERR_SELECTOR_NOT_FOUND {query_selector}"
+        elif not fill_result['ok']:
+            logger.error(f"Error entering text in selector {query_selector}. Error: {fill_result['error']}")
+            result = f"ERR_INVALID_SELECTOR {query_selector}"
+        else:
+            logger.info(f"Success. Text \"{text_to_enter}\" set successfully in the element with selector {query_selector}")
+            if fill_result['has_placeholder']:
+                try:
+                    await dismiss_placeholder(page, query_selector, text_to_enter)
+                except Exception as e:
+                    # The value is already set, so a failure to clear the placeholder does not fail the entry
+                    logger.warning(f"Unable to clear the placeholder of the element with selector {query_selector}. Error: {e}")
+            result = f"Success. Text \"{text_to_enter}\" set successfully in the element with selector {query_selector}"
         results.append({"query_selector": query_selector, "result": result})
 
+    for result in results:
+        browser_manager.schedule_notify_user(result["result"])
+
     return results
@@ -1,15 +1,23 @@
 
+import asyncio
 import os
 import time
 from typing import Annotated
 from typing import Any
 
 from ae.config import SOURCE_LOG_FOLDER_PATH
-from ae.core.playwright_manager import PlaywrightManager
+from ae.core.playwright_manager import get_playwright_manager
 from ae.utils.dom_helper import wait_for_non_loading_dom_state
 from ae.utils.get_detailed_accessibility_tree import do_get_accessibility_info
 from ae.utils.logger import logger
 
+_TEXT_DOM_PATH = os.path.join(SOURCE_LOG_FOLDER_PATH, 'text_only_dom.txt')
+
+
+def _write_text(path: str, text: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
 
 async def get_dom_with_content_type(
     content_type: Annotated[str, "The type of content to extract: 'text_only': Extracts the innerText of the highest element in the document and responds with text, or 'input_fields': Extracts the interactive elements in the dom."]
@@ -42,28 +50,29 @@ async def get_dom_with_content_type(
     logger.info(f"Executing Get DOM Command based on content_type: {content_type}")
     start_time = time.time()
     # Create and use the PlaywrightManager
-    browser_manager = PlaywrightManager(browser_type='chromium', headless=False)
+    browser_manager = get_playwright_manager()
     page = await browser_manager.get_current_page()
     if page is None: # type: ignore
         raise ValueError('No active page found. OpenURL command opens a new page.')
 
     extracted_data = None
-    await wait_for_non_loading_dom_state(page, 2000) # wait for the DOM to be ready, non loading means external resources do not need to be loaded
     user_success_message = ""
     if content_type == 'all_fields':
         logger.debug('Fetching DOM for all_fields')
+        await wait_for_non_loading_dom_state(page, 2000) # wait for the DOM to be ready, non loading means external resources do not need to be loaded
         extracted_data = await do_get_accessibility_info(page, only_input_fields=False)
         user_success_message = "Fetched all the fields in the DOM"
     elif content_type == 'input_fields':
         logger.debug('Fetching DOM for input_fields')
+        await wait_for_non_loading_dom_state(page, 2000)
         extracted_data = await do_get_accessibility_info(page, only_input_fields=True)
         user_success_message = "Fetched only input fields in the DOM"
     elif content_type == 'text_only':
-        # Extract text from the body or the highest-level element
+        # Extract text from the body or the highest-level element. innerText can be read at any time, so there is no need to wait for the DOM to finish loading
         logger.debug('Fetching DOM for text_only')
-        text_content = await page.evaluate("""() => document?.body?.innerText || document?.documentElement?.innerText || "" """)
-        with open(os.path.join(SOURCE_LOG_FOLDER_PATH, 'text_only_dom.txt'), 'w',  encoding='utf-8') as f:
-            f.write(text_content)
+        text_content: str = await page.evaluate("""() => document?.body?.innerText || document?.documentElement?.innerText || "" """)
+        logger.debug(f"Fetched {len(text_content)} characters of text content")
+        await asyncio.to_thread(_write_text, _TEXT_DOM_PATH, text_content)
         extracted_data = text_content
         user_success_message = "Fetched the text content of the DOM"
     else:
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from ae.core.playwright_manager import PlaywrightManager
+from ae.core.playwright_manager import get_playwright_manager
 from ae.utils.logger import logger
 
 
@@ -17,7 +17,7 @@ async def geturl() -> Annotated[str, "Returns the full URL of the current active
     logger.info("Executing Get URL Command")
     try:
         # Create and use the PlaywrightManager
-        browser_manager = PlaywrightManager(browser_type='chromium', headless=False)
+        browser_manager = get_playwright_manager()
         page = await browser_manager.get_current_page()
 
         if not page:
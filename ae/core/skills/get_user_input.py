@@ -1,7 +1,7 @@
 from typing import Annotated
 from typing import List  # noqa: UP035
 
-from ae.core.playwright_manager import PlaywrightManager
+from ae.core.playwright_manager import get_playwright_manager
 from ae.utils.cli_helper import answer_questions_over_cli
 
 
@@ -16,7 +16,7 @@ async def get_user_input(questions: Annotated[List[str], "List of questions to a
     - Newline separated list of questions to ask the user
     """
     answers: dict[str, str] = {}
-    browser_manager = PlaywrightManager(browser_type='chromium', headless=False)
+    browser_manager = get_playwright_manager()
     if browser_manager.ui_manager:
         for question in questions:
             answers[question] = await browser_manager.prompt_user(f"Question: {question}")
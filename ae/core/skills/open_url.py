@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from ae.core.playwright_manager import PlaywrightManager
+from ae.core.playwright_manager import get_playwright_manager
 from ae.utils.logger import logger
 
 #Annotated[Page, "The page instance that navigated to the specified URL."]
@@ -20,7 +20,7 @@ async def openurl(url: Annotated[str, "The URL to navigate to."],
     """
     logger.info(f"Opening URL: {url}")
 
-    browser_manager = PlaywrightManager(browser_type='chromium', headless=False)
+    browser_manager = get_playwright_manager()
     await browser_manager.get_browser_context()
     page = await browser_manager.get_current_page()
     # Navigate to the URL with a short timeout to ensure the initial load starts
@@ -3,7 +3,7 @@ from typing import Annotated
 
 from playwright.async_api import Page
 
-from ae.core.playwright_manager import PlaywrightManager
+from ae.core.playwright_manager import get_playwright_manager
 from ae.core.skills.click_using_selector import do_click
 from ae.utils.logger import logger
 
@@ -29,7 +29,7 @@ async def press_key_combination(key_combination: Annotated[str, "The key combina
     logger.info(f"Executing press_key_combination with key combo: {key_combination}")
     start_time = time.time()
     # Create and use the PlaywrightManager
-    browser_manager = PlaywrightManager()
+    browser_manager = get_playwright_manager()
     page = await browser_manager.get_current_page()
 
     if page is None: # type: ignore
@@ -55,7 +55,7 @@ async def press_key_combination(key_combination: Annotated[str, "The key combina
 async def press_enter_key(selector: Annotated[str, """The properly formed query selector string to identify the element to press enter key in.
                                               When \"mmid\" attribute is present, use it for the query selector."""]) -> Annotated[str, "A message indicating success or failure."]:
     logger.info(f"Executing press_enter_key with selector: \"{selector}\"")
-    browser_manager = PlaywrightManager(browser_type='chromium', headless=False)
+    browser_manager = get_playwright_manager()
     page = await browser_manager.get_current_page()
 
     if page is None: # type: ignore
@@ -0,0 +1,119 @@
+from typing import Annotated
+from typing import List  # noqa: UP035
+
+from ae.core.playwright_manager import get_playwright_manager
+from ae.utils.js_helper import evaluate_ae_helper
+from ae.utils.logger import logger
+
+
+async def run_actions(
+    actions: Annotated[List[dict[str, str]], "List of actions to perform in order. Each action is an object with 'op' ('click', 'fill' or 'select'), 'query_selector' (DOM selector query using mmid attribute) and, for 'fill' and 'select', 'value' (the text to enter or the option value to select)."]  # noqa: UP006
+) -> Annotated[List[dict[str, str]], "List of dictionaries, each containing 'query_selector' and the result of the action."]:  # noqa: UP006
+    """
+    Performs a sequence of click, fill and select actions on the current page in a single JavaScript evaluation,
+    using the window.__aeClick and window.__aeFill helpers installed on the page.
+
+    The actions are executed in the given order. Execution stops at the first action that fails, since later
+    actions usually depend on the earlier ones, and the remaining actions are reported as skipped.
+    Execution also stops after a click on a link or a form submit control, since the navigation it starts unloads
+    the page the remaining actions would run on.
+    A 'select' action fails with ERR_OPTION_NOT_FOUND when no option of the select element has the given value.
+
+    Parameters:
+    - actions: List of actions, each containing 'op', 'query_selector' and, for 'fill' and 'select', 'value'.
+
+    Returns:
+    - List of dictionaries, each containing 'query_selector' and the result of the action.
+
+    Raises:
+    - ValueError: If no active page is found. The OpenURL command opens a new page.
+
+    Example usage:
+    ```
+    await run_actions([
+        {"op": "fill", "query_selector": "[mmid='12']", "value": "test_user"},
+        {"op": "select", "query_selector": "[mmid='15']", "value": "US"},
+        {"op": "click", "query_selector": "[mmid='20']"}
+    ])
+    ```
+    """
+    logger.info(f"Executing Run Actions Command with {len(actions)} actions")
+
+    browser_manager = get_playwright_manager()
+    page = await browser_manager.get_current_page()
+    if page is None: # type: ignore
+        raise ValueError('No active page found. OpenURL command opens a new page.')
+
+    js_code = """(actions) => {
+        const runAction = (action) => {
+            const selector = action.query_selector;
+            if (action.op === "click") {
+                // Following a link or submitting a form unloads the document, so the later steps would run on a page that is going away
+                const element = window.__aeFindElement(selector);
+                const control = element && element.closest("button, input");
+                const submits = !!control && !!control.form && ["submit", "image"].includes(control.type);
+                const navigates = !!element && (!!element.closest("a[href]") || submits);
+                const outcome = window.__aeClick(selector);
+                if (outcome.action === "not_found") {
+                    return {ok: false, message: `ERR_SELECTOR_NOT_FOUND ${selector}`};
+                }
+                if (!outcome.ok) {
+                    return {ok: false, message: `ERR_CLICK_FAILED ${selector}`};
+                }
+                if (outcome.action === "select") {
+                    return {ok: true, message: `Select menu option "${outcome.value}" selected`};
+                }
+                return {ok: true, navigates: navigates, message: `Element with selector: "${selector}" clicked.`};
+            }
+            if (action.op === "fill" || action.op === "select") {
+                const outcome = window.__aeFill(selector, action.value);
+                if (!outcome.ok) {
+                    return {ok: false, message: `ERR_SELECTOR_NOT_FOUND ${selector}`};
+                }
+                if (action.op === "select") {
+                    // A select silently ends up with an empty value when no option matches
+                    if (outcome.value !== action.value) {
+                        return {ok: false, message: `ERR_OPTION_NOT_FOUND ${selector}`};
+                    }
+                    return {ok: true, message: `Select menu option "${action.value}" selected`};
+                }
+                return {ok: true, message: `Success. Text "${action.value}" set successfully in the element with selector ${selector}`};
+            }
+            return {ok: false, message: `ERR_UNSUPPORTED_ACTION ${selector}`};
+        };
+
+        const results = [];
+        let stopped = false;
+        for (const action of actions) {
+            if (stopped) {
+                results.push(`SKIPPED ${action.query_selector}`);
+                continue;
+            }
+            // Each step is guarded separately, so that the results of steps that already ran are kept when a later step throws
+            let step;
+            try {
+                step = runAction(action);
+            } catch (e) {
+                console.log(`run_actions: ${action.op} on selector ${action.query_selector} failed`, e);
+                step = {ok: false, message: `ERR_ACTION_FAILED ${action.query_selector}`};
+            }
+            stopped = !step.ok || !!step.navigates;
+            results.push(step.message);
+        }
+        return results;
+    }"""
+
+    try:
+        step_results: list[str] = await evaluate_ae_helper(page, js_code, [{"op": action.get("op", ""), "query_selector": action.get("query_selector", ""), "value": action.get("value", "")} for action in actions])
+    except Exception as e:
+        # Steps throwing are handled in the page, so this is typically a navigation triggered by one of the steps destroying
+        # the page before the results came back. Some steps may have run, so do not report them as plain failures.
+        logger.error(f"Error executing actions. Error: {e}")
+        step_results = [f"ERR_ACTION_RESULT_UNKNOWN {action.get('query_selector', '')}" for action in actions]
+
+    results: List[dict[str, str]] = []  # noqa: UP006
+    for action, result in zip(actions, step_results, strict=True):
+        results.append({"query_selector": action.get("query_selector", ""), "result": result})
+        browser_manager.schedule_notify_user(result)
+
+    return results
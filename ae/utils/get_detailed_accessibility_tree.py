@@ -1,14 +1,14 @@
+import asyncio
 import json
 import os
 import re
-import traceback
 from typing import Annotated
 from typing import Any
 
 from playwright.async_api import Page
 
 from ae.config import SOURCE_LOG_FOLDER_PATH
-from ae.core.playwright_manager import PlaywrightManager
+from ae.core.playwright_manager import get_playwright_manager
 from ae.utils.logger import logger
 
 space_delimited_mmid = re.compile(r'^[\d ]+$')
@@ -35,11 +35,13 @@ async def __inject_attributes(page: Page):
 
     last_mmid = await page.evaluate("""() => {
         const allElements = document.querySelectorAll('*');
+        const mmidIndex = new Map();
         let id = 0;
         allElements.forEach(element => {
             const origAriaLabel = element.getAttribute('aria-label');
             const mmid = `${++id}`;
             element.setAttribute('mmid', mmid);
+            mmidIndex.set(mmid, element);
             element.setAttribute('aria-label', mmid);
             //console.log(`Injected 'mmid'into element with tag: ${element.tagName} and mmid: ${mmid}`);
             if (origAriaLabel) {
@@ -47,6 +49,11 @@ async def __inject_attributes(page: Page):
                 //console.log(`Renamed 'aria-label' to 'orig-aria-label' for element with tag: ${element.tagName} and mmid: ${mmid}`);
             }
         });
+
+        // Index the elements by mmid so that window.__aeFindElement can resolve [mmid="..."] selectors without parsing them.
+        // The index is rebuilt on every DOM fetch; entries for elements that were removed or renumbered since are skipped by
+        // __aeFindElement, which then falls back to document.querySelector.
+        window.__mmidIndex = mmidIndex;
         return id;
     }""")
     logger.debug(f"Added MMID into {last_mmid} elements")
@@ -110,7 +117,7 @@ async def __fetch_dom_info(page: Page, accessibility_tree: dict[str, Any], only_
                 const tags_to_ignore = input_params.tags_to_ignore;
                 const ids_to_ignore = input_params.ids_to_ignore;
 
-                const element = document.querySelector(`[mmid="${mmid}"]`);
+                const element = window.__mmidIndex?.get(`${mmid}`) ?? document.querySelector(`[mmid="${mmid}"]`);
 
                 if (!element) {
                     console.log(`No element found with mmid: ${mmid}`);
@@ -464,7 +471,7 @@ async def get_dom_with_accessibility_info() -> Annotated[dict[str, Any] | None,
     """
     logger.debug("Executing Get Accessibility Tree Command")
     # Create and use the PlaywrightManager
-    browser_manager = PlaywrightManager(browser_type='chromium', headless=False)
+    browser_manager = get_playwright_manager()
     page = await browser_manager.get_current_page()
     if page is None: # type: ignore
         raise ValueError('No active page found')
@@ -472,6 +479,11 @@ async def get_dom_with_accessibility_info() -> Annotated[dict[str, Any] | None,
     return await do_get_accessibility_info(page)
 
 
+def __write_json(path: str, data: Any):
+    with open(path, 'w',  encoding='utf-8') as f:
+        f.write(json.dumps(data, indent=2))
+
+
 async def do_get_accessibility_info(page: Page, only_input_fields: bool = False):
     """
     Retrieves the accessibility information of a web page and saves it as JSON files.
@@ -487,9 +499,8 @@ async def do_get_accessibility_info(page: Page, only_input_fields: bool = False)
     await __inject_attributes(page)
     accessibility_tree: dict[str, Any] = await page.accessibility.snapshot(interesting_only=True)  # type: ignore
 
-    with open(os.path.join(SOURCE_LOG_FOLDER_PATH, 'json_accessibility_dom.json'), 'w',  encoding='utf-8') as f:
-        f.write(json.dumps(accessibility_tree, indent=2))
-        logger.debug("json_accessibility_dom.json saved")
+    await asyncio.to_thread(__write_json, os.path.join(SOURCE_LOG_FOLDER_PATH, 'json_accessibility_dom.json'), accessibility_tree)
+    logger.debug("json_accessibility_dom.json saved")
 
     await __cleanup_dom(page)
     try:
@@ -497,12 +508,10 @@ async def do_get_accessibility_info(page: Page, only_input_fields: bool = False)
 
         logger.debug("Enhanced Accessibility Tree ready")
 
-        with open(os.path.join(SOURCE_LOG_FOLDER_PATH, 'json_accessibility_dom_enriched.json'), 'w',  encoding='utf-8') as f:
-            f.write(json.dumps(enhanced_tree, indent=2))
-            logger.debug("json_accessibility_dom_enriched.json saved")
+        await asyncio.to_thread(__write_json, os.path.join(SOURCE_LOG_FOLDER_PATH, 'json_accessibility_dom_enriched.json'), enhanced_tree)
+        logger.debug("json_accessibility_dom_enriched.json saved")
 
         return enhanced_tree
     except Exception as e:
-        logger.error(f"Error while fetching DOM info: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error while fetching DOM info: {e}")
         return None
@@ -1,4 +1,10 @@
 import json
+from typing import Any
+from weakref import WeakSet
+
+from playwright.async_api import Page
+
+from ae.utils.logger import logger
 
 
 def escape_js_message(message: str) -> str:
@@ -12,3 +18,130 @@ def escape_js_message(message: str) -> str:
         str: The escaped message.
     """
     return json.dumps(message)
+
+
+# Helper functions installed on every page with BrowserContext.add_init_script, so that the skills can call them
+# instead of sending (and having the browser parse) the same script source on every action.
+# The definitions are wrapped in an IIFE so that evaluating the script returns undefined rather than the last assigned function.
+AE_HELPERS_JS = """
+(() => {
+window.__aeFindElement = (selector) => {
+    // [mmid="..."] selectors are resolved through the index built when mmids are injected
+    const mmidMatch = selector.match(/^\\[mmid=["']?(\\d+)["']?\\]$/);
+    if (mmidMatch && window.__mmidIndex) {
+        const element = window.__mmidIndex.get(mmidMatch[1]);
+        if (element && element.isConnected && element.getAttribute('mmid') === mmidMatch[1]) {
+            return element;
+        }
+    }
+    return document.querySelector(selector);
+};
+
+window.__aeHighlight = (element) => {
+    element.classList.add('ui_automation_pulsate');
+    element.addEventListener('animationend', () => {
+        element.classList.remove('ui_automation_pulsate')
+    });
+};
+
+// Clicks the element, or selects it in its parent select element if it is an option.
+// Returns {ok, action ('click', 'select' or 'error'), value, text, visible}.
+window.__aeClick = (selector, options = {}) => {
+    const element = window.__aeFindElement(selector);
+    if (!element) {
+        console.log(`__aeClick: Element with selector ${selector} not found`);
+        return {ok: false, action: "not_found", value: null, text: null, visible: false};
+    }
+    if (options.highlight) {
+        window.__aeHighlight(element);
+    }
+
+    if (element.scrollIntoViewIfNeeded) {
+        element.scrollIntoViewIfNeeded();
+    } else {
+        element.scrollIntoView({block: "nearest", inline: "nearest"});
+    }
+    const rect = element.getBoundingClientRect();
+    const visible = rect.width > 0 && rect.height > 0;
+
+    if (element.tagName.toLowerCase() === "option") {
+        const parent = element.closest("select");
+        if (!parent) {
+            return {ok: false, action: "error", value: element.value, text: element.text, visible: visible};
+        }
+        parent.value = element.value; // Directly set the value if possible
+        // Trigger change event if necessary
+        parent.dispatchEvent(new Event('change', { bubbles: true }));
+        console.log("Select menu option", element.text, "selected");
+        return {ok: true, action: "select", value: element.value, text: element.text, visible: visible};
+    }
+
+    console.log("About to click selector", selector);
+    element.focus();
+    // If the element is a link, make it open in the same tab
+    if (element.tagName.toLowerCase() === "a") {
+        element.target = "_self";
+    }
+    element.click();
+    return {ok: true, action: "click", value: null, text: null, visible: visible};
+};
+
+// Sets the value of the element and dispatches input and change events.
+// Returns {ok, value (the value after setting it), has_placeholder, error}.
+window.__aeFill = (selector, text_to_enter, options = {}) => {
+    let element;
+    try {
+        element = window.__aeFindElement(selector);
+    } catch (e) {
+        return {ok: false, value: null, has_placeholder: false, error: e.message};
+    }
+    if (!element) {
+        return {ok: false, value: null, has_placeholder: false, error: "not found"};
+    }
+    if (options.highlight) {
+        window.__aeHighlight(element);
+    }
+    // Use the native value setter, so that frameworks tracking the value through the instance property (e.g. React's
+    // _valueTracker) see a change when the input event is dispatched and fire their onChange handlers
+    const valueDescriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value');
+    if (valueDescriptor && valueDescriptor.set) {
+        valueDescriptor.set.call(element, text_to_enter);
+    } else {
+        element.value = text_to_enter;
+    }
+    element.dispatchEvent(new Event('input', { bubbles: true }));
+    element.dispatchEvent(new Event('change', { bubbles: true }));
+    return {ok: true, value: element.value, has_placeholder: !!element.placeholder, error: null};
+};
+})();
+"""
+
+
+_pages_with_ae_helpers: "WeakSet[Page]" = WeakSet()
+_pages_with_navigation_handler: "WeakSet[Page]" = WeakSet()
+
+
+async def evaluate_ae_helper(page: Page, expression: str, arg: Any = None) -> Any:
+    """
+    Evaluate an expression that calls the helpers defined in AE_HELPERS_JS.
+    The first time a page (or a newly navigated document) is used, the helpers are checked for and installed
+    if the page was loaded before the init script was registered.
+
+    Args:
+        page (Page): The page to evaluate the expression in.
+        expression (str): The JavaScript function to evaluate, e.g. "(selector) => window.__aeClick(selector)".
+        arg (Any, optional): The argument to pass to the function.
+
+    Returns:
+        Any: The result of the evaluation.
+    """
+    if page not in _pages_with_ae_helpers:
+        if not await page.evaluate("() => typeof window.__aeClick === 'function'"):
+            logger.debug("Installing helper functions on a page that was loaded before the init script was registered")
+            await page.evaluate(AE_HELPERS_JS)
+        if page not in _pages_with_navigation_handler:
+            _pages_with_navigation_handler.add(page)
+            # Only a navigation of the main frame replaces the document the helpers are installed on
+            page.on("framenavigated", lambda frame: _pages_with_ae_helpers.discard(page) if frame == page.main_frame else None)
+        _pages_with_ae_helpers.add(page)
+    return await page.evaluate(expression, arg)